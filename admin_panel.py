@@ -9,6 +9,8 @@ from typing import Tuple, Optional, List
 import pandas as pd
 import streamlit as st
 
+from data_loader_supabase import clear_game_cache
+
 # ---- Supabase (service role for writes) ----
 try:
     from supabase import create_client
@@ -233,6 +235,7 @@ def _upsert_games(c, df: pd.DataFrame):
     rows = df.to_dict(orient="records")
     for i in range(0, len(rows), 400):
         c.table("games").upsert(rows[i:i+400]).execute()
+    clear_game_cache()
 
 
 # ---- Casino CRUD with auto‑geocoding ----
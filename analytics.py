@@ -76,6 +76,11 @@ def render_analytics() -> None:
     display_df["avg_return"] = display_df["avg_return"].map(lambda x: f"${x:+,.2f}")
     display_df["max_drawdown"] = display_df["max_drawdown"].map(lambda x: f"${x:+,.2f}")
     display_df["sharpe"] = display_df["sharpe"].map(lambda x: f"{x:.2f}")
+    # Hand the formatted text columns to st.dataframe as Arrow-backed strings
+    # so the per-rerun Arrow serialisation doesn't convert Python objects.
+    text_cols = ["casino", "profit", "current_bankroll", "starting_bankroll",
+                 "avg_return", "max_drawdown", "sharpe"]
+    display_df = display_df.astype({c: "string[pyarrow]" for c in text_cols})
 
     # Display dataframe with metrics
     st.dataframe(display_df.rename(columns={
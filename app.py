@@ -16,6 +16,7 @@ with st.sidebar:
             st.session_state["client_lon"] = float(_coords["longitude"])
             st.success("Location saved for this session.")
 
+from bisect import bisect_right
 import numpy as np
 from ui_templates import get_css, get_header
 from trip_manager import initialize_trip_state, render_sidebar, get_session_bankroll, get_current_bankroll, blacklist_game, get_blacklisted_games, get_volatility_adjustment, get_win_streak_factor
@@ -23,57 +24,43 @@ from trip_manager import initialize_trip_state, render_sidebar, get_session_bank
 from data_loader_supabase import load_game_data
 from analytics import render_analytics
 from session_manager import render_session_tracker
-from utils import map_volatility, map_advantage, map_bonus_freq, get_game_image_url
+from utils import advantage_labels, volatility_labels, bonus_freq_labels, catalog_key
+from scoring import score_games, recommended_bets, top_k_positions
 from data_loader_supabase import get_casinos_full, update_casino_coords
 
 st.set_page_config(layout="wide", initial_sidebar_state="expanded",
                   page_title="Profit Hopper Casino Manager")
 
-initialize_trip_state()
-
-st.markdown(get_css(), unsafe_allow_html=True)
-st.markdown(get_header(), unsafe_allow_html=True)
-
-render_sidebar()
 
-trip_started = st.session_state.get('trip_started', False)
-border_colors = {
+# Strategy tiers keyed on session bankroll: tier i covers bankrolls below
+# _TIER_BOUNDS[i] (the last tier is open-ended). Each rerun does a single
+# bisect lookup instead of walking an if/elif ladder.
+_TIER_BOUNDS = (20.0, 100.0, 500.0)
+_TIER_NAMES = ("Very Conservative", "Conservative", "Moderate", "Aggressive")
+_MAX_BET_PCT = (0.05, 0.10, 0.20, 0.25)
+_MAX_BET_MIN = (0.01, 0.0, 0.0, 0.0)
+_STOP_LOSS_PCT = (0.30, 0.40, 0.50, 0.60)
+_BET_UNIT_PCT = (0.015, 0.02, 0.03, 0.04)
+_BET_UNIT_MIN = (0.01, 0.05, 0.10, 0.25)
+_BORDER_COLORS = {
     "Very Conservative": "#28a745",
     "Conservative": "#28a745",
     "Moderate": "#17a2b8",
     "Standard": "#ffc107",
     "Aggressive": "#dc3545"
 }
-try:
-    current_bankroll = get_current_bankroll()
-    session_bankroll = get_session_bankroll()
-    volatility_adjustment = get_volatility_adjustment()
-    win_streak_factor = get_win_streak_factor()
 
+
+def _compute_strategy(session_bankroll, win_streak_factor, volatility_adjustment):
+    """Return ``(strategy_type, max_bet, stop_loss, bet_unit, estimated_spins)``."""
     # Determine base strategy tiers based on session bankroll. These tiers
     # reflect conservative risk management recommendations from bankroll
     # management literature: smaller bankrolls warrant lower bet fractions
     # and tighter loss limits【3202499585933†L105-L133】【962936390273927†L110-L128】.
-    if session_bankroll < 20:
-        strategy_type = "Very Conservative"
-        max_bet = max(0.01, session_bankroll * 0.05)
-        stop_loss = session_bankroll * 0.30
-        bet_unit = max(0.01, session_bankroll * 0.015)
-    elif session_bankroll < 100:
-        strategy_type = "Conservative"
-        max_bet = session_bankroll * 0.10
-        stop_loss = session_bankroll * 0.40
-        bet_unit = max(0.05, session_bankroll * 0.02)
-    elif session_bankroll < 500:
-        strategy_type = "Moderate"
-        max_bet = session_bankroll * 0.20
-        stop_loss = session_bankroll * 0.50
-        bet_unit = max(0.10, session_bankroll * 0.03)
-    else:
-        strategy_type = "Aggressive"
-        max_bet = session_bankroll * 0.25
-        stop_loss = session_bankroll * 0.60
-        bet_unit = max(0.25, session_bankroll * 0.04)
+    tier = bisect_right(_TIER_BOUNDS, session_bankroll)
+    max_bet = max(_MAX_BET_MIN[tier], session_bankroll * _MAX_BET_PCT[tier])
+    stop_loss = session_bankroll * _STOP_LOSS_PCT[tier]
+    bet_unit = max(_BET_UNIT_MIN[tier], session_bankroll * _BET_UNIT_PCT[tier])
 
     # Adjust betting parameters using win streak and volatility factors. A
     # winning streak justifies slightly larger bets and stop-losses, while
@@ -82,22 +69,18 @@ try:
     stop_loss *= (2 - win_streak_factor)
     bet_unit *= win_streak_factor * volatility_adjustment
     estimated_spins = int(session_bankroll / bet_unit) if bet_unit > 0 else 0
+    return _TIER_NAMES[tier], max_bet, stop_loss, bet_unit, estimated_spins
 
-except Exception as e:
-    st.error(f"Error calculating strategy: {str(e)}")
-    strategy_type = "Standard"
-    max_bet = 25.0
-    stop_loss = 100.0
-    bet_unit = 5.0
-    estimated_spins = 50
 
-st.markdown(f"""
+# Static HTML for the summary cards (their CSS classes live in get_css()).
+# Built once at import; each rerun only fills in the numbers via str.format.
+_STRATEGY_CARD_TPL = """
 <div style='
     background: white;
     border-radius: 8px;
     padding: 12px;
     box-shadow: 0 1px 3px rgba(0,0,0,0.05);
-    border-left: 4px solid {border_colors.get(strategy_type, "#ffc107")};
+    border-left: 4px solid {border_color};
     margin-bottom: 0;
 '>
     <div style='display:flex; align-items:center; justify-content:center;'>
@@ -110,48 +93,9 @@ st.markdown(f"""
         </div>
     </div>
 </div>
-""", unsafe_allow_html=True)
-
-# Card styles
-st.markdown("""
-<style>
-    .card-container {
-        display: flex;
-        justify-content: space-between;
-        gap: 10px;
-        margin-bottom: 15px;
-        margin-top: 0;
-    }
-    .metric-card {
-        flex: 1;
-        background: white;
-        border-radius: 8px;
-        padding: 12px;
-        box-shadow: 0 1px 3px rgba(0,0,0,0.05);
-        border: 1px solid #e0e0e0;
-        display: flex;
-        flex-direction: column;
-        align-items: center;
-        justify-content: center;
-        text-align: center;
-        height: 100px;
-    }
-    .metric-icon {
-        font-size: 1.5rem;
-        margin-bottom: 5px;
-    }
-    .metric-label {
-        font-size: 0.8rem;
-        color: #7f8c8d;
-    }
-    .metric-value {
-        font-size: 1.1rem;
-        font-weight: bold;
-    }
-</style>
-""", unsafe_allow_html=True)
-
-st.markdown(f"""
+"""
+
+_METRIC_CARDS_TPL = """
 <div class="card-container">
     <div class="metric-card">
         <div class="metric-icon">💰</div>
@@ -169,7 +113,233 @@ st.markdown(f"""
         <div class="metric-value">${bet_unit:,.2f}</div>
     </div>
 </div>
-""", unsafe_allow_html=True)
+"""
+
+_ADJUSTMENTS_TPL = """
+<div style='display:flex; gap:10px; margin:5px 0 15px; font-size:0.85rem; flex-wrap:wrap;'>
+    <div style='font-weight:bold;'>Active Adjustments:</div>
+    <div style='display:flex; gap:8px; flex-wrap:wrap;'>
+        {indicators}
+    </div>
+</div>
+"""
+
+
+# Shared layout for recommended and extra game cards. Recommended cards add a
+# blue left border and a numbered badge through the two leading slots.
+_GAME_CARD_TPL = """
+<div class="ph-game-card"{card_style}>{badge}
+    <div class="ph-game-title">
+        🎰 <a href="{image_url}" 
+            target="_blank" 
+            style="color: #2c3e50; text-decoration: none;">
+            {game_name} 
+            <span style="font-size:0.8em; color:#7f8c8d;">(view image ↗)</span>
+        </a>
+    </div>
+    <div class="ph-game-score">⭐ Score: {score:.1f}/10</div>
+    <div class="ph-game-detail">
+        <strong>📏 Recommended Bet:</strong> ${recommended_bet:,.2f}
+    </div>
+    <div class="ph-game-detail">
+        <strong>🗂️ Type:</strong> {game_type}
+    </div>
+    <div class="ph-game-detail">
+        <strong>💸 Min Bet:</strong> ${min_bet:,.2f}
+    </div>
+    <div class="ph-game-detail">
+        <strong>🧠 Advantage Play:</strong> {advantage}
+    </div>
+    <div class="ph-game-detail">
+        <strong>🎲 Volatility:</strong> {volatility}
+    </div>
+    <div class="ph-game-detail">
+        <strong>🎁 Bonus Frequency:</strong> {bonus_frequency}
+    </div>
+    <div class="ph-game-detail">
+        <strong>🔢 RTP:</strong> {rtp:.2f}%
+    </div>
+    <div class="ph-game-detail">
+        <strong>💡 Tips:</strong> {tips}
+    </div>
+</div>
+"""
+
+_RANKED_CARD_STYLE = ' style="border-left: 6px solid #1976d2; position:relative;"'
+
+_RANK_BADGE_TPL = """
+    <div style="position:absolute; top:10px; right:10px; background:#1976d2; color:white; 
+                border-radius:50%; width:30px; height:30px; display:flex; 
+                align-items:center; justify-content:center; font-weight:bold;">
+        {rank}
+    </div>"""
+
+
+def _game_card_html(row, rank=None):
+    """Render one game card from an ``itertuples`` row; ``rank`` adds the play-order badge.
+
+    Both loaders produce the same card columns (including the resolved
+    ``card_image_url``), so every field is a plain attribute read.
+    """
+    return _GAME_CARD_TPL.format(
+        card_style=_RANKED_CARD_STYLE if rank is not None else "",
+        badge=_RANK_BADGE_TPL.format(rank=rank) if rank is not None else "",
+        image_url=row.card_image_url,
+        game_name=row.game_name,
+        score=row.Score * 10,
+        recommended_bet=row.RecommendedBet,
+        game_type=row.type,
+        min_bet=row.min_bet,
+        advantage=row.AdvantageLabel,
+        volatility=row.VolatilityLabel,
+        bonus_frequency=row.BonusLabel,
+        rtp=row.rtp,
+        tips=row.tips,
+    )
+
+
+# Refine generic tip text for display. If a tip starts with
+# "Play when bonus frequency", replace it with a more specific explanation
+# of what constitutes a high or low bonus frequency. High bonus frequency
+# implies bonus rounds occur roughly every 30–40 spins; low frequency means
+# 50+ spins per bonus【778567328630233†L105-L125】【555999948454253†L117-L121】.
+def _refine_tip(tip: str) -> str:
+    if isinstance(tip, str) and tip.strip().lower().startswith("play when bonus frequency"):
+        return (
+            "Play when bonus frequency is high (≈30–40 spins per bonus). "
+            "If you find it takes more than about 50 spins to trigger a bonus, switch to a different game as the bonus is relatively rare."  # noqa: E501
+        )
+    return tip
+
+
+def _blacklist_picked():
+    """on_change callback for the "Not Available" picker."""
+    picked = st.session_state.get("not_available_pick")
+    if picked:
+        blacklist_game(picked)
+    st.session_state["not_available_pick"] = None
+
+
+# Session count for the play order when the trip settings don't set one
+_DEFAULT_NUM_SESSIONS = 10
+
+
+# Advantage/volatility filter choices as one (comparison, rating) test each.
+# Every choice is a one-sided or single-value band on the rating, so the
+# filter is a single compare over the column instead of a low/high pair.
+_LEVEL_FILTER_TESTS = {
+    "Low (1-2)": (np.less_equal, 2),
+    "Medium (3)": (np.equal, 3),
+    "High (4-5)": (np.greater_equal, 4),
+}
+
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def _filtered_scored(_game_df, catalog_stamp, min_rtp, game_type, max_min_bet,
+                     advantage_filter, volatility_filter, search_query, blacklisted,
+                     session_bankroll, max_bet, num_sessions):
+    """Filter, score and rank the catalog for one combination of inputs.
+
+    Returns ``(n_matches, recommended_games, extra_games)``. Reruns whose inputs
+    were seen before hit the cache instead of re-scoring: coming back to the
+    Game Plan view from another view, or returning to an earlier filter
+    setting. A "Not Available" pick changes ``blacklisted`` and so re-scores.
+    ``_game_df`` is left out of the cache key; ``catalog_stamp`` (from
+    ``catalog_key``) identifies the loaded catalog instead, so hits don't hash
+    the whole frame.
+    """
+    # All filters are folded into one boolean mask over the column arrays and
+    # the catalog is indexed once, instead of materialising a new frame per
+    # filter. Range clauses that can't exclude anything (per the bounds the
+    # loader records) are skipped, and a mask that keeps every row skips the
+    # indexing too.
+    mask = np.ones(len(_game_df), dtype=bool)
+    min_bet_max = _game_df.attrs.get("min_bet_max")
+    if min_bet_max is None or max_min_bet < min_bet_max:
+        mask &= _game_df['min_bet'].to_numpy(dtype=float) <= max_min_bet
+    rtp_min = _game_df.attrs.get("rtp_min")
+    if rtp_min is None or min_rtp > rtp_min:
+        mask &= _game_df['rtp'].to_numpy(dtype=float) >= min_rtp
+    if game_type != "All":
+        mask &= (_game_df['type'] == game_type).to_numpy(dtype=bool, na_value=False)
+    if advantage_filter in _LEVEL_FILTER_TESTS:
+        test, rating = _LEVEL_FILTER_TESTS[advantage_filter]
+        mask &= test(_game_df['advantage_play_potential'].to_numpy(dtype=float), rating)
+    if volatility_filter in _LEVEL_FILTER_TESTS:
+        test, rating = _LEVEL_FILTER_TESTS[volatility_filter]
+        mask &= test(_game_df['volatility'].to_numpy(dtype=float), rating)
+    if search_query:
+        mask &= _game_df['game_name_lower'].str.contains(
+            search_query.lower(), regex=False, na=False).to_numpy(dtype=bool)
+    if blacklisted:
+        # game_name is Arrow-backed, so isin runs as an Arrow kernel without
+        # boxing every value into a Python str.
+        mask &= ~_game_df['game_name'].isin(blacklisted).to_numpy(dtype=bool, na_value=False)
+    filtered_games = _game_df if mask.all() else _game_df[mask]
+    if filtered_games.empty:
+        return 0, filtered_games, filtered_games
+    # Rank the session picks plus the 20 extras in one pass on the score
+    # array; only those rows are materialised and get the Score,
+    # RecommendedBet and card label columns, and only their tips are refined.
+    # The extras are the positional tail.
+    scores = score_games(filtered_games, session_bankroll)
+    top_idx = top_k_positions(scores, num_sessions + 20)
+    top = filtered_games.iloc[top_idx]
+    top = top.assign(
+        Score=scores[top_idx],
+        RecommendedBet=recommended_bets(top, session_bankroll, max_bet),
+        AdvantageLabel=advantage_labels(top['advantage_play_potential'].to_numpy(dtype=float)),
+        VolatilityLabel=volatility_labels(top['volatility'].to_numpy(dtype=float)),
+        BonusLabel=bonus_freq_labels(top['bonus_frequency'].to_numpy(dtype=float)),
+    )
+    if 'tips' in top.columns:
+        top['tips'] = top['tips'].map(_refine_tip)
+    # Card HTML is formatted here too, so cache hits skip templating; the
+    # session picks get their play-order badge.
+    top['CardHtml'] = [
+        _game_card_html(row, rank=i + 1 if i < num_sessions else None)
+        for i, row in enumerate(top.itertuples(index=False))
+    ]
+    return len(filtered_games), top.iloc[:num_sessions], top.iloc[num_sessions:]
+
+
+initialize_trip_state()
+
+st.markdown(get_css(), unsafe_allow_html=True)
+st.markdown(get_header(), unsafe_allow_html=True)
+
+render_sidebar()
+
+trip_started = st.session_state.get('trip_started', False)
+try:
+    current_bankroll = get_current_bankroll()
+    session_bankroll = get_session_bankroll()
+    volatility_adjustment = get_volatility_adjustment()
+    win_streak_factor = get_win_streak_factor()
+    strategy_type, max_bet, stop_loss, bet_unit, estimated_spins = _compute_strategy(
+        session_bankroll, win_streak_factor, volatility_adjustment)
+
+except Exception as e:
+    st.error(f"Error calculating strategy: {str(e)}")
+    strategy_type = "Standard"
+    max_bet = 25.0
+    stop_loss = 100.0
+    bet_unit = 5.0
+    estimated_spins = 50
+
+st.markdown(_STRATEGY_CARD_TPL.format(
+    border_color=_BORDER_COLORS.get(strategy_type, "#ffc107"),
+    strategy_type=strategy_type,
+    max_bet=max_bet,
+    stop_loss=stop_loss,
+    estimated_spins=estimated_spins,
+), unsafe_allow_html=True)
+
+st.markdown(_METRIC_CARDS_TPL.format(
+    current_bankroll=current_bankroll,
+    session_bankroll=session_bankroll,
+    bet_unit=bet_unit,
+), unsafe_allow_html=True)
 
 if win_streak_factor > 1 or volatility_adjustment > 1 or win_streak_factor < 1 or volatility_adjustment < 1:
     indicators = []
@@ -182,50 +352,27 @@ if win_streak_factor > 1 or volatility_adjustment > 1 or win_streak_factor < 1 o
     elif volatility_adjustment < 1:
         indicators.append(f"📉 -{int((1-volatility_adjustment)*100)}%")
     if indicators:
-        st.markdown(f"""
-        <div style='display:flex; gap:10px; margin:5px 0 15px; font-size:0.85rem; flex-wrap:wrap;'>
-            <div style='font-weight:bold;'>Active Adjustments:</div>
-            <div style='display:flex; gap:8px; flex-wrap:wrap;'>
-                {''.join([f'<div>{ind}</div>' for ind in indicators])}
-            </div>
-        </div>
-        """, unsafe_allow_html=True)
+        st.markdown(_ADJUSTMENTS_TPL.format(
+            indicators="".join(f"<div>{ind}</div>" for ind in indicators),
+        ), unsafe_allow_html=True)
 
-# -- SAFETY GUARD: ensure Admin tab variable exists with icons --
-try:
-    tab4  # already defined? great.
-except NameError:
-    tab1, tab2, tab3, tab4 = st.tabs(
-        ["🎮 Game Plan", "📒 Session Tracker", "📈 Trip Analytics", "🛠️ Admin"]
-    )
-
-with tab1:
+@st.fragment
+def _render_game_plan(game_df, session_bankroll, max_bet, strategy_type):
+    """Game Plan view. As a fragment, filter changes rerun only this view."""
     st.info("Find the best games for your bankroll based on RTP, volatility, and advantage play potential")
-    game_df = load_game_data()
-    # Refine generic tip text after loading. If a tip starts with
-    # "Play when bonus frequency", replace it with a more specific explanation
-    # of what constitutes a high or low bonus frequency. High bonus frequency
-    # implies bonus rounds occur roughly every 30–40 spins; low frequency means
-    # 50+ spins per bonus【778567328630233†L105-L125】【555999948454253†L117-L121】.
-    def refine_tip(tip: str) -> str:
-        if isinstance(tip, str) and tip.strip().lower().startswith("play when bonus frequency"):
-            return (
-                "Play when bonus frequency is high (≈30–40 spins per bonus). "
-                "If you find it takes more than about 50 spins to trigger a bonus, switch to a different game as the bonus is relatively rare."  # noqa: E501
-            )
-        return tip
-    if not game_df.empty and 'tips' in game_df.columns:
-        game_df['tips'] = game_df['tips'].apply(refine_tip)
     if not game_df.empty:
         with st.expander("🔍 Game Filters", expanded=False):
             col1, col2, col3 = st.columns(3)
             with col1:
                 min_rtp = st.slider("Minimum RTP (%)", 85.0, 99.9, 92.0, step=0.1)
-                game_type = st.selectbox("Game Type", ["All"] + list(game_df['type'].unique()))
+                type_choices = game_df.attrs.get("type_choices") or ["All"] + list(game_df['type'].unique())
+                game_type = st.selectbox("Game Type", type_choices)
             with col2:
+                bet_lo, bet_hi = game_df.attrs.get("min_bet_range") or (
+                    float(game_df['min_bet'].min()), float(game_df['min_bet'].max()))
                 max_min_bet = st.slider("Max Min Bet", 
-                                       float(game_df['min_bet'].min()), 
-                                       float(game_df['min_bet'].max() * 2), 
+                                       bet_lo, 
+                                       bet_hi * 2, 
                                        float(max_bet), 
                                        step=1.0)
                 advantage_filter = st.selectbox("Advantage Play Potential", 
@@ -234,243 +381,104 @@ with tab1:
                 volatility_filter = st.selectbox("Volatility", 
                                                ["All", "Low (1-2)", "Medium (3)", "High (4-5)"])
                 search_query = st.text_input("Search Game Name")
-        filtered_games = game_df[
-            (game_df['min_bet'] <= max_min_bet) &
-            (game_df['rtp'] >= min_rtp)
-        ]
-        if game_type != "All":
-            filtered_games = filtered_games[filtered_games['type'] == game_type]
-        if advantage_filter == "High (4-5)":
-            filtered_games = filtered_games[filtered_games['advantage_play_potential'] >= 4]
-        elif advantage_filter == "Medium (3)":
-            filtered_games = filtered_games[filtered_games['advantage_play_potential'] == 3]
-        elif advantage_filter == "Low (1-2)":
-            filtered_games = filtered_games[filtered_games['advantage_play_potential'] <= 2]
-        if volatility_filter == "Low (1-2)":
-            filtered_games = filtered_games[filtered_games['volatility'] <= 2]
-        elif volatility_filter == "Medium (3)":
-            filtered_games = filtered_games[filtered_games['volatility'] == 3]
-        elif volatility_filter == "High (4-5)":
-            filtered_games = filtered_games[filtered_games['volatility'] >= 4]
-        if search_query:
-            filtered_games = filtered_games[
-                filtered_games['game_name'].str.contains(search_query, case=False)
-            ]
-        blacklisted = get_blacklisted_games()
-        if blacklisted:
-            filtered_games = filtered_games[~filtered_games['game_name'].isin(blacklisted)]
-        if not filtered_games.empty:
-            # Copy to avoid modifying original DataFrame
-            games = filtered_games.copy()
-            # Calculate suitability metrics for each game based on research:
-            # - House edge: lower is better【412033640411085†L118-L170】
-            # - Advantage play potential: gives player edge【935812346186569†L144-L160】
-            # - Bonus frequency: more frequent bonuses add value【730932054797511†L135-L157】
-            # - Volatility: lower volatility reduces risk, especially for smaller bankrolls【829292623680176†L107-L132】
-            # - Min bet relative to recommended bet: ensure affordability
-
-            def compute_score(row):
-                # House edge component
-                house_edge = 1.0 - row['rtp'] / 100.0
-                rtp_component = (1 - house_edge)  # higher is better
-                # Advantage play component scaled 0-1
-                adv_factor = max(0, (row['advantage_play_potential'] - 1) / 4)
-                # Bonus frequency (already 0-1)
-                bonus_component = row['bonus_frequency']
-                # Volatility risk component: lower risk = higher score
-                vol_factor = max(0, (5 - row['volatility']) / 4)
-                # Min bet penalty: compare to 3% of session bankroll
-                recommended_bet_base = session_bankroll * 0.03
-                ratio = row['min_bet'] / recommended_bet_base if recommended_bet_base > 0 else 1
-                bet_penalty = 1 / (1 + max(ratio - 1, 0))  # 1 if ratio <= 1, declines afterwards
-                # Additional volatility penalty for small bankroll + high volatility
-                volatility_penalty = 1.0
-                if session_bankroll < 50 and row['volatility'] >= 4:
-                    volatility_penalty = 0.7
-                # Weighted sum; weights sum to 1
-                score = (
-                    0.25 * rtp_component +
-                    0.35 * adv_factor +
-                    0.15 * bonus_component +
-                    0.15 * vol_factor +
-                    0.10 * bet_penalty
-                ) * volatility_penalty
-                return score
-
-            def compute_recommended_bet(row):
-                # Base bet fraction (3% of bankroll) adjusted for volatility: higher volatility -> smaller bet
-                base_fraction = 0.03 * (3 / row['volatility'])
-                # Cap fraction to 5% for very low volatility
-                bet_fraction = min(max(base_fraction, 0.01), 0.05)
-                suggested = session_bankroll * bet_fraction
-                # Ensure bet meets the game's minimum
-                bet_amount = max(row['min_bet'], suggested)
-                # Don't exceed max_bet defined by strategy
-                bet_amount = min(bet_amount, max_bet)
-                return bet_amount
-
-            # Compute scores and recommended bets
-            games['Score'] = games.apply(compute_score, axis=1)
-            games['RecommendedBet'] = games.apply(compute_recommended_bet, axis=1)
-            # Sort games by score descending
-            games = games.sort_values('Score', ascending=False)
-            num_sessions = st.session_state.trip_settings['num_sessions']
-            recommended_games = games.head(num_sessions)
+        num_sessions = int(st.session_state.trip_settings.get('num_sessions', _DEFAULT_NUM_SESSIONS))
+        n_matches, recommended_games, extra_games = _filtered_scored(
+            game_df, catalog_key(game_df), min_rtp,
+            game_type, max_min_bet, advantage_filter,
+            volatility_filter, search_query, get_blacklisted_games(),
+            session_bankroll, max_bet, num_sessions,
+        )
+        if n_matches:
             st.subheader(f"🎯 Recommended Play Order ({len(recommended_games)} games for {num_sessions} sessions)")
             st.info(f"Based on your **{strategy_type}** strategy and ${session_bankroll:,.2f} session bankroll:")
             st.caption("Recommendations prioritize high expected return, advantage play potential, affordability, and risk management.")
             st.caption("Games with high volatility or high minimum bets relative to your bankroll are automatically penalized.")
-            st.caption("Don't see a game at your casino? Swipe left (click 'Not Available') to replace it")
+            st.caption("Don't see a game at your casino? Pick it under 'Not Available' to replace it")
             if not recommended_games.empty:
-                st.markdown('<div class="ph-game-grid">', unsafe_allow_html=True)
-                for i, (_, row) in enumerate(recommended_games.iterrows(), start=1):
-                    # Determine risk label based on volatility
-                    vol_label = map_volatility(int(row['volatility']))
-                    # Format recommended bet
-                    rec_bet_display = f"${row['RecommendedBet']:,.2f}"
-                    session_card = f"""
-                    <div class="ph-game-card" style="border-left: 6px solid #1976d2; position:relative;">
-                        <div style="position:absolute; top:10px; right:10px; background:#1976d2; color:white; 
-                                    border-radius:50%; width:30px; height:30px; display:flex; 
-                                    align-items:center; justify-content:center; font-weight:bold;">
-                            {i}
-                        </div>
-                        <div class="ph-game-title">
-                            🎰 <a href="{get_game_image_url(row['game_name'], row.get('image_url'))}" 
-                                target="_blank" 
-                                style="color: #2c3e50; text-decoration: none;">
-                                {row['game_name']} 
-                                <span style="font-size:0.8em; color:#7f8c8d;">(view image ↗)</span>
-                            </a>
-                        </div>
-                        <div class="ph-game-score">⭐ Score: {row['Score']*10:.1f}/10</div>
-                        <div class="ph-game-detail">
-                            <strong>📏 Recommended Bet:</strong> {rec_bet_display}
-                        </div>
-                        <div class="ph-game-detail">
-                            <strong>🗂️ Type:</strong> {row['type']}
-                        </div>
-                        <div class="ph-game-detail">
-                            <strong>💸 Min Bet:</strong> ${row['min_bet']:,.2f}
-                        </div>
-                        <div class="ph-game-detail">
-                            <strong>🧠 Advantage Play:</strong> {map_advantage(int(row['advantage_play_potential']))}
-                        </div>
-                        <div class="ph-game-detail">
-                            <strong>🎲 Volatility:</strong> {vol_label}
-                        </div>
-                        <div class="ph-game-detail">
-                            <strong>🎁 Bonus Frequency:</strong> {map_bonus_freq(row['bonus_frequency'])}
-                        </div>
-                        <div class="ph-game-detail">
-                            <strong>🔢 RTP:</strong> {row['rtp']:.2f}%
-                        </div>
-                        <div class="ph-game-detail">
-                            <strong>💡 Tips:</strong> {row['tips']}
-                        </div>
-                    </div>
-                    """
-                    st.markdown(session_card, unsafe_allow_html=True)
-                    if st.button(f"🚫 Not Available - {row['game_name']}", 
-                                key=f"not_available_{row['game_name']}_{i}",
-                                use_container_width=True,
-                                type="primary"):
-                        blacklist_game(row['game_name'])
-                        st.success(f"Replaced {row['game_name']} with a new recommendation")
-                        st.rerun()
-                st.markdown('</div>', unsafe_allow_html=True)
+                # All ranked cards go out as one markdown element so the grid
+                # div actually wraps them; the "Not Available" picker follows,
+                # listing the same games in play order.
+                st.markdown(
+                    '<div class="ph-game-grid">'
+                    + "".join(recommended_games['CardHtml'])
+                    + '</div>',
+                    unsafe_allow_html=True,
+                )
+                # One pills widget replaces a button per card. Blacklisting runs
+                # as its callback, before the rerun the click triggers; inside the
+                # fragment that rerun covers only this view and already sees the
+                # replacement game.
+                st.pills("🚫 Not Available", recommended_games['game_name'].tolist(),
+                         key="not_available_pick", on_change=_blacklist_picked,
+                         format_func=lambda name: f"🚫 {name}")
             else:
                 st.warning("Not enough games match your criteria for all sessions")
             # Extra games suggestions
-            extra_games = games[~games.index.isin(recommended_games.index)]
             if not extra_games.empty:
-                st.subheader(f"➕ {len(extra_games)} Additional Recommended Games")
+                st.subheader(f"➕ {n_matches - len(recommended_games)} Additional Recommended Games")
                 st.caption("These games also match your criteria but aren't in your session plan:")
-                st.markdown('<div class="ph-game-grid">', unsafe_allow_html=True)
-                for _, row in extra_games.head(20).iterrows():
-                    vol_label = map_volatility(int(row['volatility']))
-                    rec_bet_display = f"${row['RecommendedBet']:,.2f}"
-                    game_card = f"""
-                    <div class="ph-game-card">
-                        <div class="ph-game-title">
-                            🎰 <a href="{get_game_image_url(row['game_name'], row.get('image_url'))}" 
-                                target="_blank" 
-                                style="color: #2c3e50; text-decoration: none;">
-                                {row['game_name']} 
-                                <span style="font-size:0.8em; color:#7f8c8d;">(view image ↗)</span>
-                            </a>
-                        </div>
-                        <div class="ph-game-score">⭐ Score: {row['Score']*10:.1f}/10</div>
-                        <div class="ph-game-detail">
-                            <strong>📏 Recommended Bet:</strong> {rec_bet_display}
-                        </div>
-                        <div class="ph-game-detail">
-                            <strong>🗂️ Type:</strong> {row['type']}
-                        </div>
-                        <div class="ph-game-detail">
-                            <strong>💸 Min Bet:</strong> ${row['min_bet']:,.2f}
-                        </div>
-                        <div class="ph-game-detail">
-                            <strong>🧠 Advantage Play:</strong> {map_advantage(int(row['advantage_play_potential']))}
-                        </div>
-                        <div class="ph-game-detail">
-                            <strong>🎲 Volatility:</strong> {vol_label}
-                        </div>
-                        <div class="ph-game-detail">
-                            <strong>🎁 Bonus Frequency:</strong> {map_bonus_freq(row['bonus_frequency'])}
-                        </div>
-                        <div class="ph-game-detail">
-                            <strong>🔢 RTP:</strong> {row['rtp']:.2f}%
-                        </div>
-                        <div class="ph-game-detail">
-                            <strong>💡 Tips:</strong> {row['tips']}
-                        </div>
-                    </div>
-                    """
-                    st.markdown(game_card, unsafe_allow_html=True)
-                st.markdown('</div>', unsafe_allow_html=True)
+                # The extras have no per-card widgets, so the whole grid goes
+                # out as a single markdown element.
+                st.markdown(
+                    '<div class="ph-game-grid">'
+                    + "".join(extra_games['CardHtml'])
+                    + '</div>',
+                    unsafe_allow_html=True,
+                )
         else:
             st.warning("No games match your current filters. Try adjusting your criteria.")
     else:
         st.error("Failed to load game data. Please check the CSV format and column names.")
-with tab2:
-    game_df = load_game_data()
+
+
+# Streamlit executes the body of every st.tabs panel on every rerun, even the
+# hidden ones. A horizontal radio exposes the active view, so only the section
+# the user is looking at does any work.
+VIEWS = ["🎮 Game Plan", "📒 Session Tracker", "📈 Trip Analytics", "🛠️ Admin"]
+active_view = st.radio("View", VIEWS, horizontal=True, key="active_view",
+                       label_visibility="collapsed")
+
+# The Game Plan and Session Tracker views share one catalog load per rerun.
+game_df = load_game_data() if active_view in VIEWS[:2] else None
+
+if active_view == VIEWS[0]:
+    _render_game_plan(game_df, session_bankroll, max_bet, strategy_type)
+elif active_view == VIEWS[1]:
     render_session_tracker(game_df, session_bankroll)
-with tab3:
+elif active_view == VIEWS[2]:
     render_analytics()
-
-    with tab4:
-        # Admin tab accessible regardless of trip status
+else:
+    # Admin tab accessible regardless of trip status
+    try:
+        from admin_panel import show_admin_panel
+    except Exception as e:
+        st.error(f"Admin panel not available: {e}")
+    else:
+        # Simple password gate
+        secrets_general = {}
         try:
-            from admin_panel import show_admin_panel
-        except Exception as e:
-            st.error(f"Admin panel not available: {e}")
-        else:
-            # Simple password gate
+            secrets_general = st.secrets.get("general", {})
+        except Exception:
             secrets_general = {}
-            try:
-                secrets_general = st.secrets.get("general", {})
-            except Exception:
-                secrets_general = {}
-            enabled_val = str(secrets_general.get("ADMIN_ENABLED", os.environ.get("ADMIN_ENABLED", "0"))).strip().lower()
-            admin_enabled = enabled_val in ("1","true","yes","on")
-            if not admin_enabled:
-                st.info("Admin is disabled. Set ADMIN_ENABLED=1 to enable.")
+        enabled_val = str(secrets_general.get("ADMIN_ENABLED", os.environ.get("ADMIN_ENABLED", "0"))).strip().lower()
+        admin_enabled = enabled_val in ("1","true","yes","on")
+        if not admin_enabled:
+            st.info("Admin is disabled. Set ADMIN_ENABLED=1 to enable.")
+        else:
+            admin_pass = (secrets_general.get("ADMIN_PASS", os.environ.get("ADMIN_PASS","")) or "").strip()
+            if not admin_pass:
+                st.error("ADMIN_PASS not configured. Add it to [general] in secrets or set env var.")
             else:
-                admin_pass = (secrets_general.get("ADMIN_PASS", os.environ.get("ADMIN_PASS","")) or "").strip()
-                if not admin_pass:
-                    st.error("ADMIN_PASS not configured. Add it to [general] in secrets or set env var.")
+                if st.session_state.get("_admin_ok", False):
+                    show_admin_panel()
                 else:
-                    if st.session_state.get("_admin_ok", False):
-                        show_admin_panel()
-                    else:
-                        with st.form("admin_login", clear_on_submit=False):
-                            pw = st.text_input("Enter admin password", type="password")
-                            ok = st.form_submit_button("Unlock Admin")
-                        if ok:
-                            if pw == admin_pass:
-                                st.session_state["_admin_ok"] = True
-                                st.success("Admin unlocked.")
-                                st.rerun()
-                            else:
-                                st.error("Incorrect password.")
+                    with st.form("admin_login", clear_on_submit=False):
+                        pw = st.text_input("Enter admin password", type="password")
+                        ok = st.form_submit_button("Unlock Admin")
+                    if ok:
+                        if pw == admin_pass:
+                            st.session_state["_admin_ok"] = True
+                            st.success("Admin unlocked.")
+                            st.rerun()
+                        else:
+                            st.error("Incorrect password.")
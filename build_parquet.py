@@ -0,0 +1,35 @@
+#!/usr/bin/env python3
+"""
+One-time script to convert the Profit Hopper game list CSV into Parquet.
+
+This script fetches `extended_game_list.csv` from the Profit Hopper GitHub
+repository and writes it next to the app as `extended_game_list.parquet`
+(zstd-compressed). `data_loader.load_game_data()` reads that file when it
+exists, skipping the download and CSV parse, and falls back to the CSV
+otherwise. Column normalization still happens in the loader, so the file
+keeps the CSV's columns as-is.
+
+Usage:
+  python build_parquet.py [path-or-url-to-csv]
+
+The file is a manual snapshot and is git-ignored. The loader uses it for as
+long as it exists, so re-run this script whenever the upstream CSV changes
+(or delete the file to go back to the live CSV).
+"""
+
+import sys
+import pandas as pd
+
+from data_loader import GAME_CSV_URL, GAME_PARQUET_PATH
+
+
+def main() -> None:
+    source = sys.argv[1] if len(sys.argv) > 1 else GAME_CSV_URL
+    print(f"Reading {source} ...")
+    df = pd.read_csv(source)
+    df.to_parquet(GAME_PARQUET_PATH, engine="pyarrow", compression="zstd", index=False)
+    print(f"Wrote {len(df)} rows to {GAME_PARQUET_PATH}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,12 +1,27 @@
+import os
 import pandas as pd
 import streamlit as st
 from utils import normalize_column_name
+from scoring import add_card_columns, describe_catalog
+
+GAME_CSV_URL = "https://raw.githubusercontent.com/nwt002tech/profit-hopper/main/extended_game_list.csv"
+# Local columnar copy of the CSV written by build_parquet.py. It is a manual
+# snapshot: while the file exists it is used as-is, and upstream CSV edits only
+# reach the app after the script is re-run (or the file is deleted).
+GAME_PARQUET_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "extended_game_list.parquet")
+
+def _read_game_table():
+    if os.path.exists(GAME_PARQUET_PATH):
+        try:
+            return pd.read_parquet(GAME_PARQUET_PATH, engine='pyarrow')
+        except Exception as e:
+            st.warning(f"Could not read {os.path.basename(GAME_PARQUET_PATH)} ({e}); loading the CSV instead.")
+    return pd.read_csv(GAME_CSV_URL)
 
 @st.cache_data(ttl=3600)
 def load_game_data():
     try:
-        url = "https://raw.githubusercontent.com/nwt002tech/profit-hopper/main/extended_game_list.csv"
-        df = pd.read_csv(url)
+        df = _read_game_table()
         
         df.columns = [normalize_column_name(col) for col in df.columns]
         
@@ -38,6 +53,10 @@ def load_game_data():
         for col in numeric_cols:
             if col in df.columns:
                 df[col] = pd.to_numeric(df[col], errors='coerce')
+        # 1-5 ratings shrink to int8 when every value is a whole number
+        for col in ('advantage_play_potential', 'volatility'):
+            if col in df.columns:
+                df[col] = pd.to_numeric(df[col], downcast='integer')
         
         # Handle optional columns
         if 'advantage_play_potential' not in df.columns:
@@ -58,7 +77,13 @@ def load_game_data():
         # Convert NaN values to None for image_url
         df['image_url'] = df['image_url'].where(pd.notnull(df['image_url']), None)
         
-        return df.dropna(subset=['rtp', 'min_bet'])
+        # Derived columns shared with the Supabase loader
+        df = add_card_columns(df)
+        
+        df = df.dropna(subset=['rtp', 'min_bet'])
+        # Load stamp, filter choices and column bounds read by the app
+        df = describe_catalog(df)
+        return df
     except Exception as e:
         st.error(f"Error loading game data: {str(e)}")
         return pd.DataFrame()
\ No newline at end of file
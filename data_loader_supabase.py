@@ -3,6 +3,8 @@ import os
 from typing import Any, Optional, List, Tuple, Dict
 import pandas as pd
 
+from scoring import add_card_columns, describe_catalog
+
 try:
     import streamlit as st
 except Exception:
@@ -234,9 +236,10 @@ def _ensure_game_cols(df: pd.DataFrame) -> pd.DataFrame:
     for col in ("rtp", "bonus_frequency", "min_bet", "score"):
         if col in df.columns:
             df[col] = df[col].map(_to_float)
+    # 1-5 ratings: Int8 holds them (and missing values) in a byte per row.
     for col in ("volatility", "advantage_play_potential"):
         if col in df.columns:
-            df[col] = pd.to_numeric(df[col], errors="coerce").astype("Int64")
+            df[col] = pd.to_numeric(df[col], errors="coerce").astype("Int8")
     for col in ("is_hidden", "is_unavailable"):
         if col in df.columns:
             df[col] = df[col].fillna(False).astype(bool)
@@ -246,28 +249,54 @@ def _ensure_game_cols(df: pd.DataFrame) -> pd.DataFrame:
     if "game_name" not in df.columns and "name" in df.columns:
         df["game_name"] = df["name"].astype(str)
 
+    df = add_card_columns(df)
+
     lead = [c for c in expected if c in df.columns]
     rest = [c for c in df.columns if c not in lead]
     return df[lead + rest]
 
 
+def _cache_data(**kwargs):
+    # st.cache_data when Streamlit is importable; a no-op decorator otherwise.
+    if st is None:
+        return lambda fn: fn
+    return st.cache_data(**kwargs)
+
+
+@_cache_data(ttl=3600, show_spinner=False)
+def _fetch_games(_c: "Client", active_only: bool) -> pd.DataFrame:
+    # Cached by active_only only; the client is excluded from the hash.
+    # Exceptions propagate so a failed query is never cached.
+    res = _c.table("games").select(_GAMES_COLS_SELECT).order("name").execute()
+    df = pd.DataFrame(res.data or [])
+    df = _ensure_game_cols(df)
+    if active_only and "is_hidden" in df.columns:
+        df = df[df["is_hidden"] == False]
+    if "name" in df.columns:
+        df = df.sort_values("name", kind="mergesort").reset_index(drop=True)
+    return describe_catalog(df)
+
+
+def clear_game_cache() -> None:
+    """
+    Drop the cached games table so the next load_game_data() re-queries Supabase.
+    Call after writing to the games table.
+    """
+    if hasattr(_fetch_games, "clear"):
+        _fetch_games.clear()
+
+
 def load_game_data(active_only: bool = True) -> pd.DataFrame:
     """
     Your base loader: pulls games and sorts A→Z for UI.
+    Results are cached across reruns (see clear_game_cache).
     """
     c = _client()
     if c is None:
         return _ensure_game_cols(pd.DataFrame())
     try:
-        res = c.table("games").select(_GAMES_COLS_SELECT).order("name").execute()
-        df = pd.DataFrame(res.data or [])
-        df = _ensure_game_cols(df)
-        if active_only and "is_hidden" in df.columns:
-            df = df[df["is_hidden"] == False]
-        if "name" in df.columns:
-            df = df.sort_values("name", kind="mergesort").reset_index(drop=True)
-        return df
+        return _fetch_games(c, active_only)
     except Exception as e:
         if st:
             st.info(f"[load_game_data] fallback: {e}")
-        return _ensure_game_cols(pd.DataFrame())
\ No newline at end of file
+        return _ensure_game_cols(pd.DataFrame())
@@ -0,0 +1,148 @@
+import time
+
+import numpy as np
+import pandas as pd
+
+from utils import get_game_image_url
+
+# Calculate suitability metrics for each game based on research:
+# - House edge: lower is better【412033640411085†L118-L170】
+# - Advantage play potential: gives player edge【935812346186569†L144-L160】
+# - Bonus frequency: more frequent bonuses add value【730932054797511†L135-L157】
+# - Volatility: lower volatility reduces risk, especially for smaller bankrolls【829292623680176†L107-L132】
+# - Min bet relative to recommended bet: ensure affordability
+#
+# The first four terms don't depend on the bankroll; the loader precomputes
+# their weighted sum with static_score() and stores it as ``score_static``, so
+# each rerun only adds the min-bet term in score_games(). All helpers work on
+# whole columns at once with NumPy ufuncs.
+
+
+def static_score(df: pd.DataFrame) -> np.ndarray:
+    """
+    The bankroll-independent part of the game score (RTP, advantage play,
+    bonus frequency, volatility).
+    """
+    rtp = df["rtp"].to_numpy(dtype=float, na_value=np.nan)
+    adv = df["advantage_play_potential"].to_numpy(dtype=float, na_value=np.nan)
+    bonus = df["bonus_frequency"].to_numpy(dtype=float, na_value=np.nan)
+    vol = df["volatility"].to_numpy(dtype=float, na_value=np.nan)
+    # House edge component: higher RTP is better
+    house_edge = 1.0 - rtp / 100.0
+    return (
+        0.25 * (1 - house_edge) +
+        # Advantage play component scaled 0-1
+        0.35 * np.maximum(0, (adv - 1) / 4) +
+        # Bonus frequency (already 0-1)
+        0.15 * bonus +
+        # Volatility risk component: lower risk = higher score
+        0.15 * np.maximum(0, (5 - vol) / 4)
+    )
+
+
+def score_games(df: pd.DataFrame, session_bankroll: float) -> np.ndarray:
+    """Full 0-1 score for each row of ``df`` (needs the ``score_static`` column)."""
+    static = df['score_static'].to_numpy(dtype=float)
+    vol = df['volatility'].to_numpy(dtype=float)
+    min_bet = df['min_bet'].to_numpy(dtype=float)
+    # Min bet penalty: compare to 3% of session bankroll. The penalty is
+    # 1 / (1 + max(ratio - 1, 0)): 1 if ratio <= 1, declining afterwards. It is
+    # evaluated in place in one scratch buffer (``ratio`` is a fresh array, never
+    # a view of the frame) rather than allocating a temporary per operation.
+    recommended_bet_base = session_bankroll * 0.03
+    if recommended_bet_base > 0:
+        ratio = min_bet / recommended_bet_base
+    else:
+        ratio = np.ones_like(min_bet)
+    ratio -= 1
+    np.maximum(ratio, 0, out=ratio)
+    ratio += 1
+    np.reciprocal(ratio, out=ratio)
+    # Weighted sum; weights sum to 1
+    ratio *= 0.10
+    score = np.add(static, ratio, out=ratio)
+    # Additional volatility penalty for small bankroll + high volatility. The
+    # bankroll test is a scalar, so larger bankrolls skip the pass entirely and
+    # small ones touch only the penalised rows in place.
+    if session_bankroll < 50:
+        score[vol >= 4] *= 0.7
+    return score
+
+
+def recommended_bets(df: pd.DataFrame, session_bankroll: float, max_bet: float) -> np.ndarray:
+    """Suggested bet per game, between the game's minimum and the strategy's max bet."""
+    vol = df['volatility'].to_numpy(dtype=float)
+    min_bet = df['min_bet'].to_numpy(dtype=float)
+    # Base bet fraction (3% of bankroll) adjusted for volatility: higher volatility -> smaller bet
+    base_fraction = 0.03 * (3 / vol)
+    # Cap fraction to 5% for very low volatility
+    bet_fraction = np.clip(base_fraction, 0.01, 0.05)
+    suggested = session_bankroll * bet_fraction
+    # Ensure bet meets the game's minimum
+    bet_amount = np.maximum(min_bet, suggested)
+    # Don't exceed max_bet defined by strategy
+    return np.minimum(bet_amount, max_bet)
+
+
+def top_k_positions(scores: np.ndarray, k: int) -> np.ndarray:
+    """Return the positions of the ``k`` highest scores, best first.
+
+    ``np.argpartition`` finds the winners in O(n); only those ``k`` rows are
+    then sorted, instead of sorting the whole filtered catalog.
+    """
+    n = len(scores)
+    k = max(0, min(int(k), n))
+    if k < n:
+        idx = np.argpartition(-scores, k)[:k]
+    else:
+        idx = np.arange(n)
+    return idx[np.argsort(-scores[idx], kind="stable")]
+
+
+# Both game loaders (data_loader and data_loader_supabase) finish with the two
+# helpers below, so the app sees the same derived columns and catalog metadata
+# whichever source the games came from.
+
+
+def add_card_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Add the derived columns the app's filters and game cards read:
+    ``card_image_url``, ``game_name_lower`` and ``score_static``. Name columns
+    become Arrow-backed strings and ``type`` a category.
+    """
+    # Resolved card image link (stored image, else an image-search URL)
+    if "game_name" in df.columns:
+        df["card_image_url"] = [
+            get_game_image_url(n, u) for n, u in zip(df["game_name"], df["image_url"])
+        ]
+    # Lower-cased once here so the app's name search is a plain substring test.
+    df["game_name_lower"] = df["game_name"].astype(str).str.lower() if "game_name" in df.columns else ""
+    # Arrow-backed strings for the name columns the app searches; the
+    # low-cardinality type column compares as category codes.
+    df = df.astype({c: "string[pyarrow]" for c in ("game_name", "game_name_lower") if c in df.columns})
+    if "type" in df.columns:
+        df["type"] = df["type"].astype("category")
+    df["score_static"] = static_score(df)
+    return df
+
+
+def describe_catalog(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Record catalog metadata in ``df.attrs`` once the final rows are known:
+    the load stamp, Game Type choices, the Max Min Bet slider range and the
+    column bounds the app's filters use.
+    """
+    # Stamp the load so callers can key their own caches on it instead of
+    # hashing the whole frame.
+    df.attrs["loaded_at"] = time.time()
+    # Game Type dropdown choices, in catalog order of appearance.
+    df.attrs["type_choices"] = ["All"] + df["type"].unique().tolist()
+    # Max Min Bet slider range (missing values ignored, as Series.min/max do)
+    df.attrs["min_bet_range"] = (float(df["min_bet"].min()), float(df["min_bet"].max()))
+    # Column bounds that let the app skip range filters which can't exclude
+    # anything. Left unset when values are missing, since the filters drop those.
+    if len(df) and df["min_bet"].notna().all():
+        df.attrs["min_bet_max"] = float(df["min_bet"].max())
+    if len(df) and df["rtp"].notna().all():
+        df.attrs["rtp_min"] = float(df["rtp"].min())
+    return df
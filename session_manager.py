@@ -1,10 +1,54 @@
 import streamlit as st
 import pandas as pd
 from datetime import datetime
-from utils import get_csv_download_link
+from utils import get_csv_download_link, catalog_key
 from trip_manager import get_current_trip_sessions, get_current_bankroll, blacklist_game, get_blacklisted_games, record_session_performance
 from ui_templates import trip_info_box
 
+# One session row in the tracker list; filled with str.format per session.
+_SESSION_CARD_TPL = """
+<div class="session-card">
+    <div style="display: flex; justify-content: space-between; flex-wrap: wrap;">
+        <div style="flex: 1; min-width: 200px;">
+            <strong>📅 {date}</strong> | 🎮 {game}
+        </div>
+        <div style="flex: 1; min-width: 250px; text-align: right;">
+            <span>💵 ${money_in:,.2f} → 💰 ${money_out:,.2f}</span>
+            <span class="{profit_class}"> | 📈 ${profit:+,.2f}</span>
+        </div>
+    </div>
+    <div style="margin-top: 8px; font-size: 0.9em;">
+        <strong>📝 Notes:</strong> {notes}
+    </div>
+</div>
+"""
+
+# Avg profit / max drawdown / win rate strip under the session list.
+_SESSION_SUMMARY_TPL = """
+<div class="compact-summary" style="margin:20px 0;">
+    <div class="summary-card">
+        <div class="summary-icon">📊</div>
+        <div class="summary-label">Avg Profit/Session</div>
+        <div class="summary-value">${avg_profit:+,.2f}</div>
+    </div>
+    <div class="summary-card">
+        <div class="summary-icon">📉</div>
+        <div class="summary-label">Max Drawdown</div>
+        <div class="summary-value">${max_drawdown:+,.2f}</div>
+    </div>
+    <div class="summary-card">
+        <div class="summary-icon">🏆</div>
+        <div class="summary-label">Win Rate</div>
+        <div class="summary-value">{win_rate:.1f}%</div>
+    </div>
+</div>
+"""
+
+@st.cache_data(max_entries=8, show_spinner=False)
+def _game_options(_game_df, catalog_stamp):
+    """Selectbox choices for the session form, built once per loaded catalog."""
+    return ["Select Game"] + _game_df['game_name'].unique().tolist()
+
 def save_session(session_date, game_played, money_in, money_out, session_notes):
     profit = money_out - money_in
     new_session = {
@@ -61,7 +105,7 @@ def render_session_tracker(game_df, session_bankroll):
                                           value=float(session_bankroll),
                                           step=5.0)
             with col2:
-                game_options = ["Select Game"] + list(game_df['game_name'].unique()) if not game_df.empty else ["Select Game"]
+                game_options = _game_options(game_df, catalog_key(game_df)) if not game_df.empty else ["Select Game"]
                 game_played = st.selectbox("🎮 Game Played", options=game_options)
                 money_out = st.number_input("💰 Money Out", 
                                            min_value=0.0, 
@@ -87,27 +131,14 @@ def render_session_tracker(game_df, session_bankroll):
         # Sort sessions by date descending
         sorted_sessions = sorted(current_trip_sessions, key=lambda x: x['date'], reverse=True)
         
-        for session in sorted_sessions:
-            profit = session['profit']
-            profit_class = "positive-profit" if profit >= 0 else "negative-profit"
-            
-            session_card = f"""
-            <div class="session-card">
-                <div style="display: flex; justify-content: space-between; flex-wrap: wrap;">
-                    <div style="flex: 1; min-width: 200px;">
-                        <strong>📅 {session['date']}</strong> | 🎮 {session['game']}
-                    </div>
-                    <div style="flex: 1; min-width: 250px; text-align: right;">
-                        <span>💵 ${session['money_in']:,.2f} → 💰 ${session['money_out']:,.2f}</span>
-                        <span class="{profit_class}"> | 📈 ${profit:+,.2f}</span>
-                    </div>
-                </div>
-                <div style="margin-top: 8px; font-size: 0.9em;">
-                    <strong>📝 Notes:</strong> {session['notes']}
-                </div>
-            </div>
-            """
-            st.markdown(session_card, unsafe_allow_html=True)
+        # Session cards carry no widgets, so they go out as one markdown block.
+        st.markdown("".join(
+            _SESSION_CARD_TPL.format(
+                profit_class="positive-profit" if session['profit'] >= 0 else "negative-profit",
+                **session,
+            )
+            for session in sorted_sessions
+        ), unsafe_allow_html=True)
         
         # Calculate session analytics
         profits = [s['profit'] for s in sorted_sessions]
@@ -115,25 +146,11 @@ def render_session_tracker(game_df, session_bankroll):
         max_drawdown = min(profits)
         win_rate = sum(1 for p in profits if p > 0) / len(profits) * 100
         
-        st.markdown(f"""
-        <div class="compact-summary" style="margin:20px 0;">
-            <div class="summary-card">
-                <div class="summary-icon">📊</div>
-                <div class="summary-label">Avg Profit/Session</div>
-                <div class="summary-value">${avg_profit:+,.2f}</div>
-            </div>
-            <div class="summary-card">
-                <div class="summary-icon">📉</div>
-                <div class="summary-label">Max Drawdown</div>
-                <div class="summary-value">${max_drawdown:+,.2f}</div>
-            </div>
-            <div class="summary-card">
-                <div class="summary-icon">🏆</div>
-                <div class="summary-label">Win Rate</div>
-                <div class="summary-value">{win_rate:.1f}%</div>
-            </div>
-        </div>
-        """, unsafe_allow_html=True)
+        st.markdown(_SESSION_SUMMARY_TPL.format(
+            avg_profit=avg_profit,
+            max_drawdown=max_drawdown,
+            win_rate=win_rate,
+        ), unsafe_allow_html=True)
         
         # Export sessions to CSV
         st.subheader("Export Data")
@@ -29,26 +29,33 @@ from browser_location import render_geo_target, request_location  # provided abo
 
 # ===================== Public API (kept stable) =====================
 
-def initialize_trip_state() -> None:
-    st.session_state.setdefault("trip_active", False)
-    st.session_state.setdefault("current_trip_id", None)
-
-    st.session_state.setdefault("trip_settings", {
+# Session-state defaults, applied with one setdefault loop per rerun. Mutable
+# defaults are built by a factory so sessions never share the same object.
+_TRIP_STATE_DEFAULTS: Dict[str, Any] = {
+    "trip_active": False,
+    "current_trip_id": None,
+    "trip_settings": lambda: {
         "near_me": False,
         "nearby_radius": 30,
         "selected_casino": None,
         "casino": None,               # for session_manager compatibility
         "selected_game": None,
         "starting_bankroll": 0.0,     # for session_manager compatibility
-    })
+    },
+    "user_coords": None,   # {"lat":..,"lon":..}
+    "geo_source": None,
+    "_ph_prev_nearme": False,
+    # keep safe defaults used elsewhere
+    "win_streak_factor": 1.0,
+    "volatility_adjustment": 1.0,
+}
 
-    st.session_state.setdefault("user_coords", None)   # {"lat":..,"lon":..}
-    st.session_state.setdefault("geo_source", None)
-    st.session_state.setdefault("_ph_prev_nearme", False)
 
-    # keep safe defaults used elsewhere
-    st.session_state.setdefault("win_streak_factor", 1.0)
-    st.session_state.setdefault("volatility_adjustment", 1.0)
+def initialize_trip_state() -> None:
+    state = st.session_state
+    for key, default in _TRIP_STATE_DEFAULTS.items():
+        if key not in state:
+            state[key] = default() if callable(default) else default
 
 
 def get_session_bankroll() -> float:
@@ -59,14 +66,16 @@ def get_current_bankroll() -> float:
     return float(st.session_state.get("current_bankroll", 0.0))
 
 
-def get_blacklisted_games() -> List[str]:
-    return st.session_state.get("blacklist_games", []) or []
+def get_blacklisted_games() -> Tuple[str, ...]:
+    # Stored as a sorted tuple so callers can hash it (e.g. as a cache key)
+    # without copying it first.
+    return tuple(st.session_state.get("blacklist_games", ()) or ())
 
 
 def blacklist_game(game_name: str) -> None:
-    bl = set(st.session_state.get("blacklist_games", []))
+    bl = set(st.session_state.get("blacklist_games", ()))
     bl.add(game_name)
-    st.session_state["blacklist_games"] = sorted(bl)
+    st.session_state["blacklist_games"] = tuple(sorted(bl))
 
 
 def get_volatility_adjustment() -> float:
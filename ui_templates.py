@@ -199,6 +199,45 @@ def get_css():
         border-radius: 4px;
         font-weight: bold;
     }
+    
+    /* Bankroll / session / bet unit metric cards */
+    .card-container {
+        display: flex;
+        justify-content: space-between;
+        gap: 10px;
+        margin-bottom: 15px;
+        margin-top: 0;
+    }
+    
+    .metric-card {
+        flex: 1;
+        background: white;
+        border-radius: 8px;
+        padding: 12px;
+        box-shadow: 0 1px 3px rgba(0,0,0,0.05);
+        border: 1px solid #e0e0e0;
+        display: flex;
+        flex-direction: column;
+        align-items: center;
+        justify-content: center;
+        text-align: center;
+        height: 100px;
+    }
+    
+    .metric-icon {
+        font-size: 1.5rem;
+        margin-bottom: 5px;
+    }
+    
+    .metric-label {
+        font-size: 0.8rem;
+        color: #7f8c8d;
+    }
+    
+    .metric-value {
+        font-size: 1.1rem;
+        font-weight: bold;
+    }
     </style>
     """
 
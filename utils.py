@@ -1,27 +1,32 @@
 import re
 import base64
+import numpy as np
 import pandas as pd
 import urllib.parse
+from functools import lru_cache
+
+# Rating → label tables, built once at import instead of on every call
+_ADVANTAGE_LABELS = {
+    5: "⭐️⭐️⭐️⭐️⭐️ Excellent advantage opportunities",
+    4: "⭐️⭐极⭐️⭐️ Strong potential for skilled players",
+    3: "⭐️⭐️⭐️ Moderate advantage play value",
+    2: "⭐️⭐️ Low advantage value",
+    1: "⭐️ Minimal advantage potential"
+}
+
+_VOLATILITY_LABELS = {
+    1: "📈 Very low volatility (frequent small wins)",
+    2: "📈 Low volatility",
+    3: "📊 Medium volatility",
+    4: "📉 High volatility",
+    5: "📉 Very high volatility (rare big wins)"
+}
 
 def map_advantage(value):
-    mapping = {
-        5: "⭐️⭐️⭐️⭐️⭐️ Excellent advantage opportunities",
-        4: "⭐️⭐极⭐️⭐️ Strong potential for skilled players",
-        3: "⭐️⭐️⭐️ Moderate advantage play value",
-        2: "⭐️⭐️ Low advantage value",
-        1: "⭐️ Minimal advantage potential"
-    }
-    return mapping.get(value, "Unknown")
+    return _ADVANTAGE_LABELS.get(value, "Unknown")
 
 def map_volatility(value):
-    mapping = {
-        1: "📈 Very low volatility (frequent small wins)",
-        2: "📈 Low volatility",
-        3: "📊 Medium volatility",
-        4: "📉 High volatility",
-        5: "📉 Very high volatility (rare big wins)"
-    }
-    return mapping.get(value, "Unknown")
+    return _VOLATILITY_LABELS.get(value, "Unknown")
 
 def map_bonus_freq(value):
     if value >= 0.4:
@@ -35,6 +40,48 @@ def map_bonus_freq(value):
     else:
         return "🎁 Very rare bonuses"
 
+# Array forms of the label tables for labelling whole columns at once. Index 0
+# is "Unknown" and catches missing or out-of-range ratings.
+_ADVANTAGE_LABEL_ARR = np.array(
+    ["Unknown"] + [_ADVANTAGE_LABELS[i] for i in range(1, 6)], dtype=object)
+_VOLATILITY_LABEL_ARR = np.array(
+    ["Unknown"] + [_VOLATILITY_LABELS[i] for i in range(1, 6)], dtype=object)
+_BONUS_FREQ_BOUNDS = np.array([0.1, 0.2, 0.3, 0.4])
+_BONUS_FREQ_LABEL_ARR = np.array([map_bonus_freq(v) for v in (0.0, 0.1, 0.2, 0.3, 0.4)], dtype=object)
+
+def _rating_index(values):
+    # Truncate toward zero as int() does, so a fractional 4.5 reads as 4
+    r = np.trunc(np.asarray(values, dtype=float))
+    ok = (r >= 1) & (r <= 5)
+    return np.where(ok, r, 0).astype(np.intp)
+
+def advantage_labels(values):
+    """Vectorised map_advantage over an array of 1-5 ratings."""
+    return _ADVANTAGE_LABEL_ARR[_rating_index(values)]
+
+def volatility_labels(values):
+    """Vectorised map_volatility over an array of 1-5 ratings."""
+    return _VOLATILITY_LABEL_ARR[_rating_index(values)]
+
+def bonus_freq_labels(values):
+    """Vectorised map_bonus_freq; missing values fall in the lowest band, as there."""
+    f = np.asarray(values, dtype=float)
+    idx = np.searchsorted(_BONUS_FREQ_BOUNDS, f, side="right")
+    idx[np.isnan(f)] = 0
+    return _BONUS_FREQ_LABEL_ARR[idx]
+
+def catalog_key(df):
+    """Cache key identifying a loaded game catalog.
+
+    Loaders stamp ``df.attrs['loaded_at']``; frames without the stamp fall back
+    to a hash of their contents. ``id()`` is not usable here: cached loaders
+    return a fresh copy per call and freed addresses get reused.
+    """
+    stamp = df.attrs.get("loaded_at")
+    if stamp is not None:
+        return stamp
+    return int(pd.util.hash_pandas_object(df, index=False).sum())
+
 def normalize_column_name(name):
     return re.sub(r'\W+', '_', name.lower().strip())
 
@@ -47,6 +94,11 @@ def get_game_image_url(game_name, default_image=None):
     """Generate a Google image search URL for the game"""
     if default_image and not pd.isna(default_image):
         return default_image
+    return _image_search_url(game_name)
+
+@lru_cache(maxsize=4096)
+def _image_search_url(game_name):
+    # Cards are re-rendered on every rerun; quote each name only once
     query = f"{game_name} slot machine"
     encoded_query = urllib.parse.quote(query)
     return f"https://www.google.com/search?tbm=isch&q={encoded_query}"